@@ -70,7 +70,13 @@ function runSolver(
       }
 
       try {
-        const data = JSON.parse(stdoutData);
+        // Line-delimited JSON: progress lines, then a single {"final": ...}
+        const lines = stdoutData.trim().split('\n');
+        const last: unknown = JSON.parse(lines[lines.length - 1] ?? '');
+        const data =
+          typeof last === 'object' && last != null && 'final' in last
+            ? last.final
+            : last;
         if (!Array.isArray(data)) {
           log.error('Invalid solver output', data);
           return reject(new Error('Invalid solver output'));
@@ -0,0 +1 @@
+"""Make the flat solver modules importable from ``tests/``."""
@@ -5,39 +5,52 @@ run_balloon_solver.py
 CLI / stream wrapper for `balloon_camp_solver.solve`.
 
 Input  : one JSON object on **stdin** (see README).
-Success: manifest JSON on **stdout** · exit-code 0
+Success: line-delimited JSON on **stdout** · exit-code 0
+         ``{"partial": manifest, "objective": n}`` per improving solution,
+         then one ``{"final": manifest}`` line
 Failure: error JSON on **stderr** · exit-code 1 or 2
 """
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 import traceback
 import random
 from typing import List, Any, NoReturn
 
+import orjson
+
 from vehicle_solver import solve
 from transformer import transform_input_payload, transform_output
 from vehicle_group_solver import build_clusters
 
+_MAX_TRACE_CHARS = 16 * 1024
+
 
 def _emit_error(exc: Exception, exit_code: int) -> NoReturn:
     """Serialize *exc* as one-line JSON to **stderr** and quit."""
     err_payload = {
         "type": type(exc).__name__,
         "message": str(exc),
-        "trace": traceback.format_exc(),
+        # keep the innermost frames, bound the payload for the reading pipe
+        "trace": traceback.format_exc()[-_MAX_TRACE_CHARS:],
     }
 
-    json.dump(err_payload, sys.stderr)
+    sys.stderr.buffer.write(orjson.dumps(err_payload, option=orjson.OPT_APPEND_NEWLINE))
+    sys.stderr.flush()
     sys.exit(exit_code)
 
 
+def _write_line(obj: dict[str, Any]) -> None:
+    """Write *obj* as one JSON line to **stdout** and flush it to the reader."""
+    sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.flush()
+
+
 def _load_stdin_payload() -> dict[str, Any]:
     """Parse a single JSON object from STDIN. Exit 2 on failure."""
     try:
-        payload = json.load(sys.stdin)
+        payload = orjson.loads(sys.stdin.buffer.read())
         if not isinstance(payload, dict):
             raise ValueError("STDIN payload must be a single JSON object")
         return payload
@@ -176,6 +189,14 @@ def main(argv: List[str] | None = None) -> None:
             balloons=balloons, cars=cars, people=people, precluster=preclusers
         )
 
+        def emit_partial(partial: dict[str, Any], objective: float) -> None:
+            _write_line(
+                {
+                    "partial": transform_output(partial, cluster, groups),
+                    "objective": objective,
+                }
+            )
+
         manifest = solve(
             balloons=balloons,
             cars=cars,
@@ -184,6 +205,7 @@ def main(argv: List[str] | None = None) -> None:
             frozen=frozen,
             past_flights=history,
             leg=args.flight_leg,
+            on_solution=emit_partial,
             w_pilot_fairness=args.w_pilot_fairness,
             w_passenger_fairness=args.w_passenger_fairness,
             w_no_solo_participant=args.w_no_solo_participant,
@@ -198,8 +220,7 @@ def main(argv: List[str] | None = None) -> None:
         )
 
         output = transform_output(manifest, cluster, groups)
-        json.dump(output, sys.stdout)
-        sys.stdout.write("\n")
+        _write_line({"final": output})
         sys.exit(0)
 
     except Exception as exc:
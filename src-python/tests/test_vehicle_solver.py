@@ -0,0 +1,124 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from vehicle_solver import solve
+from vehicle_group_solver import build_clusters
+
+WEIGHTS = dict(
+    w_pilot_fairness=1,
+    w_passenger_fairness=20,
+    w_no_solo_participant=30,
+    w_divers_nationalities=3,
+    w_cluster_passenger_balance=7,
+    w_vehicle_rotation=5,
+    w_low_flights_second_leg=20,
+    w_overweight_second_leg=50,
+    counselor_flight_discount=1,
+    default_person_weight=80,
+    time_limit_s=5,
+)
+
+
+def make_camp():
+    people = [
+        {
+            "id": f"p{i}",
+            "name": f"P{i}",
+            "nationality": ["de", "fr", "pl"][i % 3],
+            "role": "counselor" if i % 4 == 0 else "participant",
+            "weight": 60 + i,
+            "flights": i % 3,
+        }
+        for i in range(14)
+    ]
+    ids = [p["id"] for p in people]
+    balloons = [
+        {
+            "id": f"b{i}",
+            "capacity": 4,
+            "max_weight": 400,
+            "allowed_operators": ids[i * 2 : i * 2 + 2],
+        }
+        for i in range(2)
+    ]
+    cars = [
+        {
+            "id": f"c{i}",
+            "capacity": 5,
+            "trailer_clutch": i < 2,
+            "allowed_operators": ids[6 + i * 2 : 6 + i * 2 + 3],
+        }
+        for i in range(3)
+    ]
+    cluster = build_clusters(balloons=balloons, cars=cars, people=people)
+    return balloons, cars, people, cluster
+
+
+@pytest.fixture
+def camp():
+    return make_camp()
+
+
+@pytest.fixture
+def many_workers(monkeypatch):
+    # partial-solution callbacks run on CP-SAT worker threads only when
+    # the search is parallel
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+
+
+def test_on_solution_receives_improving_manifests(camp, many_workers):
+    balloons, cars, people, cluster = camp
+    seen = []
+
+    manifest = solve(
+        balloons,
+        cars,
+        people,
+        cluster,
+        past_flights=[],
+        leg=1,
+        on_solution=lambda partial, objective: seen.append((partial, objective)),
+        **WEIGHTS,
+    )
+
+    assert seen
+    assert all(partial.keys() == manifest.keys() for partial, _ in seen)
+
+
+def test_on_solution_error_is_reraised_from_solve():
+    # a regression aborts the interpreter (exit 134), so run it in a child
+    script = textwrap.dedent("""
+        import os
+
+        os.cpu_count = lambda: 8
+
+        from test_vehicle_solver import WEIGHTS, make_camp
+        from vehicle_solver import solve
+
+        calls = []
+
+        def on_solution(partial, objective):
+            calls.append(objective)
+            raise BrokenPipeError("reader gone")
+
+        try:
+            solve(
+                *make_camp(), past_flights=[], leg=1, on_solution=on_solution, **WEIGHTS
+            )
+        except BrokenPipeError as exc:
+            print(len(calls), exc)
+        """)
+    here = Path(__file__).resolve().parent
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(here), str(here.parent)])}
+
+    proc = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env
+    )
+
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    assert proc.stdout.strip() == "1 reader gone"
@@ -15,15 +15,19 @@ A single‐slot (one flight) solver with:
 
 All weights are user‑tunable kwargs.
 
-Dependencies: `ortools>=9.9`.  Run the smoke‑test at bottom to verify.
+Dependencies: `ortools>=9.9`, `numpy`.  Run the smoke‑test at bottom to verify.
 """
 
-from itertools import product
+import os
+from itertools import compress, product
 from collections import defaultdict
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable
 
+import numpy as np
 from ortools.sat.python import cp_model
 
+_BALLOON, _CAR = 0, 1  # values of the per-vehicle kind mask
+
 
 # ---------------------------------------------------------------------------
 # Main one-leg solver (sequential-leg workflow)
@@ -37,6 +41,8 @@ def solve(
     frozen: Optional[List[Dict[str, str]]] = None,
     past_flights: Optional[List[Dict[str, Any]]] = None,
     leg: int = None,
+    # called as on_solution(manifest, objective) for every improving solution
+    on_solution: Optional[Callable[[Dict[str, Any], float], None]] = None,
     # soft weights
     # Defaults are overwritten by command-line args
     w_pilot_fairness: int,
@@ -80,12 +86,8 @@ def solve(
     # ------------------------------------------------------------------
     # 0.a Fast look-ups
     # ------------------------------------------------------------------
-    vehicles = [dict(**b, kind="balloon") for b in balloons] + [
-        dict(**c, kind="car") for c in cars
-    ]
-
     people_by_id = {p["id"]: p for p in people}
-    vehicles_by_id = {v["id"]: v for v in vehicles}
+    vehicles_by_id = {v["id"]: v for v in [*balloons, *cars]}
 
     person_ids = list(people_by_id)
     vehicle_ids = list(vehicles_by_id)
@@ -102,145 +104,165 @@ def solve(
     }
 
     capacity = {v: vehicles_by_id[v]["capacity"] for v in vehicle_ids}
-    kind = {v: vehicles_by_id[v]["kind"] for v in vehicle_ids}
-    allowed_op = {v: set(vehicles_by_id[v]["allowed_operators"]) for v in vehicle_ids}
+    # vehicle kind by column index; balloons come first, then cars
+    kind_arr = np.concatenate(
+        [np.full(len(balloons), _BALLOON, np.int8), np.full(len(cars), _CAR, np.int8)]
+    )
+    # qualified operators per vehicle column, as sorted person row indices
+    p_idx = {p: i for i, p in enumerate(person_ids)}
+    allowed_op_idx = [
+        np.array(
+            sorted(
+                {p_idx[p] for p in vehicles_by_id[v]["allowed_operators"] if p in p_idx}
+            ),
+            dtype=np.int32,
+        )
+        for v in vehicle_ids
+    ]
     max_weight = {v: vehicles_by_id[v].get("max_weight", -1) for v in vehicle_ids}
 
     # ------------------------------------------------------------------
-    # 0.b  Historic “fresh vehicle” map
+    # 0.b  Historic “fresh vehicle” map & previous-leg cluster map
     # ------------------------------------------------------------------
-    seen = defaultdict(set)
-    if past_flights:
-        for fl in past_flights:
-            for grp in fl["groups"]:
-                bid = grp["balloon"]["id"]
-                seen[grp["balloon"]["operator"]].add(bid)
-                for p in grp["balloon"]["passengers"]:
-                    seen[p].add(bid)
-                for car in grp["cars"]:
-                    cid = car["id"]
-                    seen[car["operator"]].add(cid)
-                    for p in car["passengers"]:
-                        seen[p].add(cid)
+    seen_mask, allowed_mask = history_masks(past_flights, person_ids, vehicle_ids)
+
+    # stay-in-cluster after leg-0: seats outside the previous cluster never
+    # get a var, see `history_masks`
+    if leg is not None and leg > 1:
+        homeless = np.flatnonzero(~allowed_mask.any(axis=1))
+        if homeless.size:
+            p = person_ids[homeless[0]]
+            raise ValueError(
+                f"Person {people_by_id[p]['name']} not allowed in any vehicle"
+            )
+        seat_mask = allowed_mask
+    else:
+        seat_mask = np.ones_like(seen_mask)
 
     # ------------------------------------------------------------------
     # 1. CP-SAT model
     # ------------------------------------------------------------------
     model = cp_model.CpModel()
 
-    op = {  # operator‑selection vars
-        (p, v): model.NewBoolVar(f"op_{p}_{v}")
-        for p, v in product(person_ids, vehicle_ids)
-    }
+    seats = list(compress(product(person_ids, vehicle_ids), seat_mask.ravel()))
+
     pax = {  # passenger‑seat vars (operator counts as passenger)
-        (p, v): model.NewBoolVar(f"pax_{p}_{v}")
-        for p, v in product(person_ids, vehicle_ids)
+        (p, v): model.NewBoolVar(f"pax_{p}_{v}") for p, v in seats
     }
+    op = {}  # operator‑selection vars, only for qualified operators
+    for v_i, v in enumerate(vehicle_ids):
+        cand = allowed_op_idx[v_i]
+        for p_i in cand[seat_mask[cand, v_i]]:  # may operate *and* sit here
+            p = person_ids[p_i]
+            op[p, v] = model.NewBoolVar(f"op_{p}_{v}")
+
+    # flat per-vehicle / per-person var lists, passed to LinearExpr in one call
+    seat_ids = {v: [p for p in person_ids if (p, v) in pax] for v in vehicle_ids}
+    pax_pv = {v: [pax[p, v] for p in seat_ids[v]] for v in vehicle_ids}
+    pax_vp = {p: [pax[p, v] for v in vehicle_ids if (p, v) in pax] for p in person_ids}
+    op_ids = {v: [p for p in seat_ids[v] if (p, v) in op] for v in vehicle_ids}
+    op_pv = {v: [op[p, v] for p in op_ids[v]] for v in vehicle_ids}
+    op_vp = {p: [op[p, v] for v in vehicle_ids if (p, v) in op] for p in person_ids}
 
     # ------------------------------------------------------------------
     # 2. Hard constraints
     # ------------------------------------------------------------------
     # 2.1 each person exactly one seat / one operator role
     for p in person_ids:
-        model.Add(sum(pax[p, v] for v in vehicle_ids) == 1)  # seat exactly once
-        model.Add(sum(op[p, v] for v in vehicle_ids) <= 1)  # ≤1 operator role
+        model.Add(cp_model.LinearExpr.Sum(pax_vp[p]) == 1)  # seat exactly once
+        model.Add(cp_model.LinearExpr.Sum(op_vp[p]) <= 1)  # ≤1 operator role
 
-    # 2.2 operator ⇒ passenger + operator eligibility
-    for p, v in product(person_ids, vehicle_ids):
-        model.AddImplication(op[p, v], pax[p, v])
-        if p not in allowed_op[v]:
-            model.Add(op[p, v] == 0)
+    # 2.2 operator ⇒ passenger (eligibility: op var exists only if allowed)
+    for (p, v), var in op.items():
+        model.AddImplication(var, pax[p, v])
 
     # 2.3 capacity limit
     for v in vehicle_ids:
-        model.Add(sum(pax[p, v] for p in person_ids) <= capacity[v])
+        model.Add(cp_model.LinearExpr.Sum(pax_pv[v]) <= capacity[v])
 
     # 2.4 weight limit
     for v in vehicle_ids:
         if max_weight[v] > 0:
-            model.Add(sum(weight[p] * pax[p, v] for p in person_ids) <= max_weight[v])
+            w_arr = [weight[p] for p in seat_ids[v]]
+            model.Add(
+                cp_model.LinearExpr.WeightedSum(pax_pv[v], w_arr) <= max_weight[v]
+            )
 
     # 2.5 occupancy flag & exactly‑one operator if occupied
+    occupied = {}
     for v in vehicle_ids:
         occ = model.NewBoolVar(f"occ_{v}")
-        seats = sum(pax[p, v] for p in person_ids)
-        model.Add(seats >= 1).OnlyEnforceIf(occ)
-        model.Add(seats == 0).OnlyEnforceIf(occ.Not())
-        model.Add(sum(op[p, v] for p in person_ids) == 1).OnlyEnforceIf(occ)
-        model.Add(sum(op[p, v] for p in person_ids) == 0).OnlyEnforceIf(occ.Not())
+        if pax_pv[v]:
+            model.AddMaxEquality(occ, pax_pv[v])  # occ ⇔ any seat taken
+        else:
+            model.Add(occ == 0)  # nobody may sit here
+        model.Add(cp_model.LinearExpr.Sum(op_pv[v]) == occ)
+        occupied[v] = occ
 
     # 2.6 frozen seats
     for lock in frozen:
         p, v = lock["person"], lock["vehicle"]
+        if (p, v) not in pax:
+            raise ValueError(
+                f"Person {people_by_id[p]['name']} is not allowed in vehicle {v}"
+            )
         if lock["role"] == "operator":
+            if (p, v) not in op:
+                raise ValueError(
+                    f"Person {people_by_id[p]['name']} is not allowed to operate {v}"
+                )
             model.Add(op[p, v] == 1)
             model.Add(pax[p, v] == 1)
         elif lock["role"] == "passenger":
             model.Add(pax[p, v] == 1)
-            model.Add(op[p, v] == 0)
+            if (p, v) in op:
+                model.Add(op[p, v] == 0)
         else:
             raise ValueError("unknown role")
 
-    # 2.7 stay-in-cluster after leg-0
-    if leg is not None and leg > 1:
-        # take cluster from *previous* leg (last entry)
-        prev = past_flights[-1]
-        allowed = defaultdict(set)
-
-        for grp in prev["groups"]:
-            cluster_vids = {grp["balloon"]["id"]} | {car["id"] for car in grp["cars"]}
-            # operator + passengers
-            ids = (
-                {grp["balloon"]["operator"]}
-                | set(grp["balloon"]["passengers"])
-                | {car["operator"] for car in grp["cars"]}
-                | {p for car in grp["cars"] for p in car["passengers"]}
-            )
-            for pid in ids:
-                allowed[pid].update(cluster_vids)
-
-        for p in person_ids:
-            for v in vehicle_ids:
-                if not allowed.get(p):
-                    raise ValueError(
-                        f"Person {people_by_id[p]['name']} not allowed in any vehicle"
-                    )
-                if v not in allowed.get(p, set()):
-                    model.Add(pax[p, v] == 0)
-
     # ------------------------------------------------------------------
     # 3. Objective
     # ------------------------------------------------------------------
-    objective_terms = []
+    # collected as flat (var, coeff) lists and summed in a single call
+    obj_vars = []
+    obj_coeffs = []
     max_flights = max(flights_so_far.values()) + 1
 
     # 3.1 pilot fairness
-    for p, v in product(person_ids, vehicle_ids):
-        if p in allowed_op[v]:
-            bonus = max_flights - flights_so_far[p]
-            objective_terms.append(-w_pilot_fairness * bonus * op[p, v])
+    for (p, v), var in op.items():
+        bonus = max_flights - flights_so_far[p]
+        obj_vars.append(var)
+        obj_coeffs.append(-w_pilot_fairness * bonus)
 
     # 3.2 low-flight pax in balloons (participants > counselors)
-    for p, v in product(person_ids, vehicle_ids):
-        if kind[v] == "balloon":
-            bonus = max_flights - flights_so_far[p]
-            if not is_participant[p]:
-                bonus = max(bonus - counselor_flight_discount, 0)
-            objective_terms.append(-w_passenger_fairness * bonus * pax[p, v])
+    pax_bonus = {}
+    for p in person_ids:
+        bonus = max_flights - flights_so_far[p]
+        if not is_participant[p]:
+            bonus = max(bonus - counselor_flight_discount, 0)
+        pax_bonus[p] = -w_passenger_fairness * bonus
+
+    for v_i, v in enumerate(vehicle_ids):
+        if kind_arr[v_i] == _BALLOON:
+            obj_vars += pax_pv[v]
+            obj_coeffs += [pax_bonus[p] for p in seat_ids[v]]
 
     # 3.3 mo participants alone
-    for v in vehicle_ids:
-        if kind[v] != "car":
+    for v_i, v in enumerate(vehicle_ids):
+        if kind_arr[v_i] != _CAR:
             continue
 
-        part_sat = sum(is_participant[p] * pax[p, v] for p in person_ids)
+        part_sat = cp_model.LinearExpr.Sum(
+            [pax[p, v] for p in seat_ids[v] if is_participant[p]]
+        )
 
         solo_part = model.NewBoolVar(f"solo_part_{v}")
 
         model.Add(part_sat == 1).OnlyEnforceIf(solo_part)
         model.Add(part_sat != 1).OnlyEnforceIf(solo_part.Not())
 
-        objective_terms.append(+w_no_solo_participant * solo_part)
+        obj_vars.append(solo_part)
+        obj_coeffs.append(+w_no_solo_participant)
 
     # 3.4 cluster passenger deviation
     if leg is None or leg == 1:
@@ -249,40 +271,55 @@ def solve(
         avg_ground = (n_people - seats_in_air) // len(cluster)
 
         for bid, car_ids in cluster.items():
-            crew_cars = sum(pax[p, v] for v in car_ids for p in person_ids)
+            crew_cars = cp_model.LinearExpr.Sum([x for v in car_ids for x in pax_pv[v]])
 
             # absolute deviation |crew - avg_ground|
             dev_pos = model.NewIntVar(0, n_people, f"devP_{bid}")
             dev_neg = model.NewIntVar(0, n_people, f"devN_{bid}")
             model.Add(crew_cars - avg_ground == dev_pos - dev_neg)
-            objective_terms.append(w_cluster_passenger_balance * (dev_pos + dev_neg))
+            obj_vars += [dev_pos, dev_neg]
+            obj_coeffs += [w_cluster_passenger_balance] * 2
 
     # 3.5 diversity
     if len(nationalities) > 1:
+        by_nat = defaultdict(list)
+        for p in person_ids:
+            by_nat[nationality[p]].append(p)
+
         for v in vehicle_ids:
-            cnt_nat = {}
-            for nat in nationalities:
-                cnt = model.NewIntVar(0, capacity[v], f"cnt_{v}_{nat}")
+            cnt_nat = []
+            for nat, members in by_nat.items():
+                cnt = model.NewIntVar(
+                    0, min(capacity[v], len(members)), f"cnt_{v}_{nat}"
+                )
                 model.Add(
-                    cnt == sum(pax[p, v] for p in person_ids if nationality[p] == nat)
+                    cnt
+                    == cp_model.LinearExpr.Sum(
+                        [pax[p, v] for p in members if (p, v) in pax]
+                    )
                 )
-                cnt_nat[nat] = cnt
+                cnt_nat.append(cnt)
 
             maj = model.NewIntVar(0, capacity[v], f"maj_{v}")
-            model.AddMaxEquality(maj, list(cnt_nat.values()))
-
-            total = model.NewIntVar(0, capacity[v], f"tot_{v}")
-            model.Add(total == sum(pax[p, v] for p in person_ids))
-
-            minority = model.NewIntVar(0, capacity[v], f"minor_{v}")
-            model.Add(minority == total - maj)
-
-            objective_terms.append(-w_divers_nationalities * minority)
-
-    # 3.6 fresh vehicle (passengers only)
-    for p, v in product(person_ids, vehicle_ids):
-        if v not in seen[p]:
-            objective_terms.append(-w_vehicle_rotation * (pax[p, v] - op[p, v]))
+            model.AddMaxEquality(maj, cnt_nat)
+
+            # minority = seats taken - largest nationality group
+            obj_vars += cnt_nat + [maj]
+            obj_coeffs += [-w_divers_nationalities] * len(cnt_nat)
+            obj_coeffs.append(+w_divers_nationalities)
+
+    # 3.6 fresh vehicle (passengers only): -w·pax + w·op on unseen (p, v)
+    # Everyone takes exactly one seat (2.1), so -w·sum(unseen pax) is
+    # +w·sum(seen pax) up to a constant. The seen side is sparse and empty
+    # without history. pax is keyed in `seats` order (row-major seat_mask).
+    seen = seen_mask[seat_mask].tolist()
+    seen_pax = list(compress(pax.values(), seen))
+    seen_keys = set(compress(pax.keys(), seen))
+    fresh_op = [var for key, var in op.items() if key not in seen_keys]
+
+    obj_vars += seen_pax + fresh_op
+    obj_coeffs += [+w_vehicle_rotation] * len(seen_pax)
+    obj_coeffs += [+w_vehicle_rotation] * len(fresh_op)
 
     # 3.7 soft cluster balance
     if leg is not None and leg == 1:
@@ -293,7 +330,8 @@ def solve(
             if future_seats >= len(sorted_f)
             else sorted_f[future_seats - 1]
         )
-        low = {p: int(flights_so_far[p] <= cutoff) for p in person_ids}
+        low_ids = [p for p in person_ids if flights_so_far[p] <= cutoff]
+        low_w_arr = [weight[p] for p in low_ids]
 
         for b in balloons:
             bid = b["id"]
@@ -302,12 +340,15 @@ def solve(
             car_ids = cluster[bid]
 
             # how many low-flight pax we actually placed in those cars
-            low_in_cars = sum(low[p] * pax[p, v] for v in car_ids for p in person_ids)
+            low_in_cars = cp_model.LinearExpr.Sum(
+                [pax[p, v] for v in car_ids for p in low_ids]
+            )
 
             short = model.NewIntVar(0, target, f"short_{bid}")
             model.Add(short >= target - low_in_cars)
 
-            objective_terms.append(+w_low_flights_second_leg * short)
+            obj_vars.append(short)
+            obj_coeffs.append(+w_low_flights_second_leg)
 
         for bid, car_ids in cluster.items():
             if max_weight[bid] <= 0:
@@ -315,35 +356,168 @@ def solve(
 
             weight_budget = max_weight[bid]
 
-            low_weight_in_cars = sum(
-                weight[p] * low[p] * pax[p, v] for v in car_ids for p in person_ids
+            low_weight_in_cars = cp_model.LinearExpr.WeightedSum(
+                [pax[p, v] for v in car_ids for p in low_ids],
+                low_w_arr * len(car_ids),
             )
 
             over = model.NewIntVar(0, weight_budget, f"over_{bid}")
             model.Add(over >= low_weight_in_cars - weight_budget)
-            objective_terms.append(w_overweight_second_leg * over)
+            obj_vars.append(over)
+            obj_coeffs.append(w_overweight_second_leg)
 
-    model.Minimize(sum(objective_terms))
+    _minimize_weighted_sum(model, obj_vars, obj_coeffs)
 
     # ------------------------------------------------------------------
     # 4. Solve
     # ------------------------------------------------------------------
     solver = cp_model.CpSolver()
     solver.parameters.max_time_in_seconds = time_limit_s
-    solver.parameters.num_search_workers = 8
-
-    if solver.Solve(model) not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-        raise RuntimeError("No feasible assignment")
+    # more workers than cores only adds portfolio overhead, and tiny models
+    # are solved by presolve + a few workers anyway
+    n_bool = len(op) + len(pax)
+    workers = min(8, os.cpu_count() or 1)
+    if n_bool < 200:
+        workers = min(workers, 4)
+    solver.parameters.num_search_workers = workers
+
+    # settle who operates what first; seats follow from occupancy
+    model.AddDecisionStrategy(
+        list(op.values()), cp_model.CHOOSE_FIRST, cp_model.SELECT_MIN_VALUE
+    )
+
+    # 4.1 warm start: people stay in their cluster, so the previous leg's
+    # seats are a good first guess; CP-SAT repairs whatever no longer fits
+    if leg is not None and leg > 1:
+        # sets: a duplicate hint makes CP-SAT reject the whole model
+        op_hints, pax_hints = set(), set()
+        for grp in past_flights[-1]["groups"]:
+            for veh in [grp["balloon"], *grp["cars"]]:
+                v = veh["id"]
+                op_hints.add((veh["operator"], v))
+                pax_hints.update((p, v) for p in [veh["operator"], *veh["passengers"]])
+        for key in op_hints & op.keys():
+            model.AddHint(op[key], 1)
+        for key in pax_hints & pax.keys():
+            model.AddHint(pax[key], 1)
+        solver.parameters.repair_hint = True
 
     # ------------------------------------------------------------------
     # 5. Manifest
     # ------------------------------------------------------------------
-    manifest = {v: {"operator": None, "passengers": []} for v in vehicle_ids}
-    for p, v in product(person_ids, vehicle_ids):
-        if solver.BooleanValue(op[p, v]):
-            manifest[v]["operator"] = p
-            continue
-        if solver.BooleanValue(pax[p, v]):
-            manifest[v]["passengers"].append(p)
+    def read_manifest(value: Callable[[Any], bool]) -> Dict[str, Any]:
+        """Build the manifest from *value*, a solver's or callback's BooleanValue."""
+        manifest = {v: {"operator": None, "passengers": []} for v in vehicle_ids}
+        for v in vehicle_ids:
+            if not value(occupied[v]):
+                continue
 
-    return manifest
+            # occupied ⇒ exactly one operator (2.5)
+            operator = next(p for p in op_ids[v] if value(op[p, v]))
+            manifest[v]["operator"] = operator
+            manifest[v]["passengers"] = [
+                p for p in seat_ids[v] if p != operator and value(pax[p, v])
+            ]
+        return manifest
+
+    callback = _SolutionStream(read_manifest, on_solution) if on_solution else None
+    status = solver.Solve(model, callback)
+    if callback is not None and callback.error is not None:
+        raise callback.error
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        raise RuntimeError("No feasible assignment")
+
+    return read_manifest(solver.BooleanValue)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+class _SolutionStream(cp_model.CpSolverSolutionCallback):
+    """Hand every improving solution to *on_solution* while CP-SAT keeps going.
+
+    An exception escaping into a CP-SAT worker thread aborts the process, so
+    it is stored in *error* instead, the search is stopped and `solve`
+    re-raises it once ``Solve`` has returned.
+    """
+
+    def __init__(self, read_manifest, on_solution):
+        super().__init__()
+        self._read_manifest = read_manifest
+        self._on_solution = on_solution
+        self.error: Optional[BaseException] = None
+
+    def on_solution_callback(self) -> None:
+        if self.error is not None:
+            return
+        try:
+            manifest = self._read_manifest(self.BooleanValue)
+            self._on_solution(manifest, self.ObjectiveValue())
+        except BaseException as exc:  # noqa: BLE001
+            self.error = exc
+            self.StopSearch()
+
+
+def history_masks(
+    past_flights: Optional[List[Dict[str, Any]]],
+    person_ids: List[str],
+    vehicle_ids: List[str],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Flatten the flight history and return ``(seen_mask, allowed_mask)``.
+
+    Both are boolean ``person × vehicle`` arrays in the given id order:
+    *seen_mask* marks every vehicle a person has sat in, *allowed_mask* the
+    vehicles of the cluster they were in on the last flight.
+    """
+    p_idx = {p: i for i, p in enumerate(person_ids)}
+    v_idx = {v: i for i, v in enumerate(vehicle_ids)}
+
+    # flatten the history into index arrays: every (person, vehicle) seat
+    # taken, plus the group index everyone had on the last flight
+    rows, cols = [], []
+    person_group = np.full(len(person_ids), -1, dtype=np.int32)
+    vehicle_group = np.full(len(vehicle_ids), -1, dtype=np.int32)
+    last = len(past_flights or []) - 1
+
+    for f_i, fl in enumerate(past_flights or []):
+        for g_i, grp in enumerate(fl["groups"]):
+            for veh in [grp["balloon"], *grp["cars"]]:
+                people_in = [veh["operator"], *veh["passengers"]]
+                p_is = [p_idx[p] for p in people_in if p in p_idx]
+                v_i = v_idx.get(veh["id"])
+                if f_i == last:
+                    person_group[p_is] = g_i
+                    if v_i is not None:
+                        vehicle_group[v_i] = g_i
+                if v_i is not None:
+                    rows += p_is
+                    cols += [v_i] * len(p_is)
+
+    seen_mask = np.zeros((len(person_ids), len(vehicle_ids)), dtype=bool)
+    seen_mask[rows, cols] = True
+
+    # same group on the last flight ⇔ allowed; -1 marks "no group"
+    allowed_mask = (person_group[:, None] == vehicle_group[None, :]) & (
+        person_group[:, None] >= 0
+    )
+
+    return seen_mask, allowed_mask
+
+
+def _minimize_weighted_sum(
+    model: cp_model.CpModel, variables: List[cp_model.IntVar], coeffs: List[int]
+) -> None:
+    """Write ``minimize sum(coeffs * variables)`` straight into the model proto.
+
+    Same result as ``model.Minimize(LinearExpr.WeightedSum(...))`` without
+    building and re-flattening an expression tree; repeated vars are merged.
+    """
+    merged = defaultdict(int)
+    for var, coeff in zip(variables, coeffs):
+        merged[var.Index()] += coeff
+
+    model.ClearObjective()
+    objective = model.Proto().objective
+    objective.vars.extend(merged.keys())
+    objective.coeffs.extend(merged.values())
+    objective.scaling_factor = 1